@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+import argparse
+import itertools
+import math
+import os
+import sqlite3
+from multiprocessing import Pool, shared_memory
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.model_selection import KFold, train_test_split
+
+# ✅ Search Space & Output Location
+BEST_PARAMS_PATH = "models/pitcher_best_params.csv"
+FEATURES = ["innings_pitched", "opponent_encoded", "home_away", "opponent_k_rate", "recent_k9"]
+PARAM_GRID = {
+	"n_estimators": [50, 100, 200],
+	"max_depth": [None, 3, 5, 8],
+	"min_samples_leaf": [1, 2, 4],
+}
+
+# ✅ Function to Convert Innings to Proper Fraction
+def convert_innings(innings):
+	""" Convert innings pitched (6.1 -> 6.333, 6.2 -> 6.667) """
+	parts = str(innings).split(".")
+	whole = int(parts[0])
+	decimal_part = int(parts[1]) if len(parts) > 1 else 0
+
+	if decimal_part == 1:
+		return whole + (1/3)
+	elif decimal_part == 2:
+		return whole + (2/3)
+	else:
+		return whole
+
+# ✅ Load Training Rows Per Pitcher (Same Filtering & Split as mlb_model.py)
+def load_training_data():
+	""" Return {player: (X_train, y_train)} using the exact rows mlb_model.py trains on """
+	conn = sqlite3.connect("mlb_data.db")
+	df = pd.read_sql("SELECT * FROM pitcher_stats", conn)
+	conn.close()
+
+	df["innings_pitched"] = df["innings_pitched"].apply(convert_innings)
+	df["strikeouts"] = pd.to_numeric(df["strikeouts"], errors="coerce")
+
+	label_encoder = joblib.load("models/opponent_label_encoder.pkl")
+	df = df[df["opponent"].notna() & (df["opponent"] != "")]
+	df = df[df["opponent"].isin(set(label_encoder.classes_))]
+	df["opponent_encoded"] = label_encoder.transform(df["opponent"])
+
+	df["avg_ip_per_game"] = df.groupby("player")["innings_pitched"].transform("mean")
+	df = df[df["avg_ip_per_game"] >= 3.0]
+	df["recent_k9"] = df.groupby("player", group_keys=False)[["strikeouts", "innings_pitched"]].apply(
+		lambda x: (x["strikeouts"].rolling(5, min_periods=1).sum() / x["innings_pitched"].rolling(5, min_periods=1).sum()) * 9
+	)
+
+	data = {}
+	for player in df["player"].unique().tolist():
+		player_data = df[df["player"] == player]
+		if player_data.shape[0] > 5:
+			player_data = player_data.dropna()
+			X = player_data[FEATURES]
+			y = player_data["strikeouts"]
+			X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+			data[player] = (X_train.to_numpy(dtype=np.float64), y_train.to_numpy(dtype=np.float64))
+	return data
+
+# ✅ Build Candidate Configurations (Full Grid or Random Sample)
+def build_configs(mode, n_iter, seed):
+	if mode == "grid":
+		keys = list(PARAM_GRID)
+		return [dict(zip(keys, values)) for values in itertools.product(*PARAM_GRID.values())]
+
+	rng = np.random.default_rng(seed)
+	depths = [None, 2, 3, 4, 5, 6, 8, 10]
+	configs = []
+	while len(configs) < n_iter:
+		config = {
+			"n_estimators": int(rng.integers(25, 301)),
+			"max_depth": depths[rng.integers(len(depths))],
+			"min_samples_leaf": int(rng.integers(1, 7)),
+		}
+		if config not in configs:
+			configs.append(config)
+	return configs
+
+# ✅ Worker State: Views Onto the Shared Feature Block (Attached Once Per Process)
+_shm = None
+_X = None
+_y = None
+_offsets = None
+_configs = None
+_n_folds = None
+
+def _init_worker(shm_name, n_rows, offsets, configs, n_folds):
+	global _shm, _X, _y, _offsets, _configs, _n_folds
+	_shm = shared_memory.SharedMemory(name=shm_name)
+	block = np.ndarray((n_rows, len(FEATURES) + 1), dtype=np.float64, buffer=_shm.buf)
+	_X = block[:, :-1]
+	_y = block[:, -1]
+	_offsets = offsets
+	_configs = configs
+	_n_folds = n_folds
+
+def _evaluate(task):
+	""" Fit one config on one CV fold for each listed pitcher and return their fold MAEs """
+	config_idx, fold, pitcher_ids = task
+	config = _configs[config_idx]
+	maes = []
+	for pitcher_id in pitcher_ids:
+		start, stop = _offsets[pitcher_id]
+		X, y = _X[start:stop], _y[start:stop]
+		folds = KFold(n_splits=_n_folds, shuffle=True, random_state=42).split(X)
+		train_idx, val_idx = next(itertools.islice(folds, fold, None))
+		model = RandomForestRegressor(random_state=42, n_jobs=1, **config)
+		model.fit(X[train_idx], y[train_idx])
+		maes.append(float(np.abs(model.predict(X[val_idx]) - y[val_idx]).mean()))
+	return config_idx, pitcher_ids, maes
+
+# ✅ Successive Halving Over CV Folds: Each Pitcher Drops Its Worst Configs After Every Fold
+def run_search(data, configs, n_folds, eta, workers, chunk_size=16):
+	players = [player for player, (X, _) in data.items() if len(X) >= n_folds]
+	skipped = len(data) - len(players)
+	if skipped:
+		print(f"⚠️ Skipping {skipped} pitchers with fewer than {n_folds} training rows (default settings apply).")
+
+	# ✅ Pack Every Pitcher's Rows Into One Shared Block
+	offsets = []
+	n_rows = 0
+	for player in players:
+		offsets.append((n_rows, n_rows + len(data[player][0])))
+		n_rows += len(data[player][0])
+	width = len(FEATURES) + 1
+	shm = shared_memory.SharedMemory(create=True, size=max(n_rows * width * 8, 1))
+	try:
+		block = np.ndarray((n_rows, width), dtype=np.float64, buffer=shm.buf)
+		for player, (start, stop) in zip(players, offsets):
+			X, y = data[player]
+			block[start:stop, :-1] = X
+			block[start:stop, -1] = y
+		del block
+
+		mae_sums = np.zeros((len(players), len(configs)))
+		alive = np.ones((len(players), len(configs)), dtype=bool)
+
+		with Pool(workers, initializer=_init_worker, initargs=(shm.name, n_rows, offsets, configs, n_folds)) as pool:
+			for fold in range(n_folds):
+				tasks = [
+					(config_idx, fold, pitcher_ids[i:i + chunk_size])
+					for config_idx in range(len(configs))
+					for pitcher_ids in [np.flatnonzero(alive[:, config_idx]).tolist()]
+					for i in range(0, len(pitcher_ids), chunk_size)
+				]
+				for config_idx, pitcher_ids, maes in pool.imap_unordered(_evaluate, tasks):
+					mae_sums[pitcher_ids, config_idx] += maes
+				print(f"✅ Fold {fold + 1}/{n_folds}: evaluated {int(alive.sum())} pitcher/config pairs")
+
+				# ✅ Keep Only the Best 1/eta Configs Per Pitcher Before the Next Fold
+				if fold < n_folds - 1:
+					for pitcher_id in range(len(players)):
+						candidates = np.flatnonzero(alive[pitcher_id])
+						keep = max(1, math.ceil(len(candidates) / eta))
+						ranked = candidates[np.argsort(mae_sums[pitcher_id, candidates], kind="stable")]
+						alive[pitcher_id, ranked[keep:]] = False
+	finally:
+		shm.close()
+		shm.unlink()
+
+	# ✅ Pick Each Pitcher's Best Surviving Config (Ties Go to the Smaller Forest)
+	rows = []
+	for pitcher_id, player in enumerate(players):
+		candidates = np.flatnonzero(alive[pitcher_id])
+		best = min(candidates, key=lambda c: (mae_sums[pitcher_id, c], configs[c]["n_estimators"]))
+		rows.append({
+			"player": player,
+			**configs[best],
+			"cv_mae": round(mae_sums[pitcher_id, best] / n_folds, 3),
+			"n_train": len(data[player][0]),
+		})
+	return pd.DataFrame(rows)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Search random forest settings for every pitcher model at once.")
+	parser.add_argument("--mode", choices=["grid", "random"], default="grid")
+	parser.add_argument("--n-iter", type=int, default=20, help="Configs to sample in random mode")
+	parser.add_argument("--folds", type=int, default=3)
+	parser.add_argument("--eta", type=float, default=2.0, help="Keep the best 1/eta configs per pitcher after each fold")
+	parser.add_argument("--workers", type=int, default=os.cpu_count())
+	parser.add_argument("--seed", type=int, default=42)
+	args = parser.parse_args()
+
+	data = load_training_data()
+	configs = build_configs(args.mode, args.n_iter, args.seed)
+	print(f"✅ Searching {len(configs)} configs for {len(data)} pitchers with {args.workers} workers.")
+
+	best_params = run_search(data, configs, args.folds, args.eta, args.workers)
+	best_params.to_csv(BEST_PARAMS_PATH, index=False)
+	print(f"✅ Best settings saved to '{BEST_PARAMS_PATH}'. Rerun mlb_model.py to train with them.")
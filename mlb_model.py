@@ -67,6 +67,18 @@ df["recent_k9"] = df.groupby("player", group_keys=False)[["strikeouts", "innings
 )
 
 
+# ✅ Load Per-Pitcher Forest Settings from mlb_hyperparameter_search.py (If Available)
+best_params_path = "models/pitcher_best_params.csv"
+best_params = {}
+if os.path.exists(best_params_path):
+	for row in pd.read_csv(best_params_path).to_dict("records"):
+		best_params[row["player"]] = {
+			"n_estimators": int(row["n_estimators"]),
+			"max_depth": None if pd.isna(row["max_depth"]) else int(row["max_depth"]),
+			"min_samples_leaf": int(row["min_samples_leaf"]),
+		}
+	print(f"✅ Loaded tuned settings for {len(best_params)} pitchers.")
+
 # ✅ Get Unique Players
 players = df["player"].unique().tolist()
 
@@ -85,7 +97,8 @@ for player in players:
 		X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 	
 		# ✅ Train Model
-		model = RandomForestRegressor(n_estimators=100, random_state=42)
+		params = best_params.get(player, {"n_estimators": 100})
+		model = RandomForestRegressor(random_state=42, **params)
 		model.fit(X_train, y_train)
 	
 		# ✅ Save Model per Player